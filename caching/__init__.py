@@ -0,0 +1,13 @@
+__all__ = [
+    'BatchedRedisBackend',
+    'LocalCachedBackend',
+    'ORJSONCoder',
+    'cache_with_dynamic_expire',
+    'single_flight'
+]
+
+from .batched_redis_backend import BatchedRedisBackend
+from .dynamic_expire import cache_with_dynamic_expire
+from .local_cached_backend import LocalCachedBackend
+from .orjson_coder import ORJSONCoder
+from .single_flight import single_flight
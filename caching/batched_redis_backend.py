@@ -0,0 +1,238 @@
+import asyncio
+import random
+from logging import Logger
+from typing import Any, Awaitable, Optional, Tuple
+
+from fastapi_cache.backends.redis import RedisBackend
+from redis.asyncio.client import AbstractRedis
+
+from .dynamic_expire import effective_expire
+
+ttl_value = Tuple[int, Optional[str]]
+
+
+def jittered_expire(expire: Optional[int], jitter: float) -> Optional[int]:
+    """
+    Returns expiration time randomly changed by up to the given fraction, so keys set together don't expire together.
+
+    :param expire: expiration time in seconds (None if forever).
+    :param jitter: maximal relative change of expiration time.
+    """
+
+    if expire is None:
+        return None
+    return max(1, random.randint(int(expire * (1 - jitter)), int(expire * (1 + jitter))))
+
+
+class BatchedRedisBackend(RedisBackend):
+    """
+    Class represents :class:`RedisBackend` that coalesces concurrent reads and writes into pipelines.
+
+    Requests arriving within the batching window are sent to Redis in a single round-trip.
+    Until :meth:`start` is called, the backend behaves like plain :class:`RedisBackend`.
+    Expiration time of every key is jittered to spread expiration of keys that were set together.
+    Expiration time can be chosen by :func:`~caching.dynamic_expire.cache_with_dynamic_expire`.
+    """
+
+    __batch_size: int
+    __batch_window: float
+    __ttl_jitter: float
+    __logger: Logger
+    __get_queue: asyncio.Queue[tuple[str, asyncio.Future[ttl_value]]]
+    __set_queue: asyncio.Queue[tuple[str, str, Optional[int], asyncio.Future[None]]]
+    __workers: list[asyncio.Task[None]]
+
+    def __init__(self, redis: AbstractRedis, logger: Logger, batch_size: int, batch_window_ms: int, ttl_jitter: float):
+        super().__init__(redis)
+        self.__batch_size = batch_size
+        self.__batch_window = batch_window_ms / 1000
+        self.__ttl_jitter = ttl_jitter
+        self.__logger = logger
+        self.__workers = []
+
+    def start(self) -> None:
+        """
+        Starts background tasks that flush batches. Must be called in async context (where event loop exists).
+        """
+
+        self.__logger.info('Starting Redis batching (batch size %s, window %s s) ...', self.__batch_size,
+                           self.__batch_window)
+        self.__get_queue = asyncio.Queue()
+        self.__set_queue = asyncio.Queue()
+        self.__workers = [
+            asyncio.create_task(self.__run_get_batches()),
+            asyncio.create_task(self.__run_set_batches()),
+        ]
+
+    async def stop(self) -> None:
+        """
+        Stops background tasks. Requests issued afterwards are sent to Redis one by one,
+        as well as requests that were queued but not sent yet.
+        """
+
+        if not self.__workers:
+            return
+
+        self.__logger.info('Stopping Redis batching ...')
+        workers, self.__workers = self.__workers, []
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+        pending_gets = self.__drain(self.__get_queue)
+        pending_sets = self.__drain(self.__set_queue)
+        if not pending_gets and not pending_sets:
+            return
+
+        self.__logger.info('Sending %s pending Redis commands one by one ...', len(pending_gets) + len(pending_sets))
+        get_with_ttl = super().get_with_ttl
+        set_value = super().set
+        await asyncio.gather(
+            *(self.__complete(future, get_with_ttl(key)) for key, future in pending_gets),
+            *(self.__complete(future, set_value(key, value, expire)) for key, value, expire, future in pending_sets),
+        )
+
+    async def get_with_ttl(self, key: str) -> ttl_value:
+        if not self.__workers:
+            return await super().get_with_ttl(key)
+
+        future: asyncio.Future[ttl_value] = asyncio.get_running_loop().create_future()
+        self.__get_queue.put_nowait((key, future))
+        return await future
+
+    async def set(self, key: str, value: str, expire: Optional[int] = None) -> None:
+        expire = jittered_expire(effective_expire(expire), self.__ttl_jitter)
+
+        if not self.__workers:
+            return await super().set(key, value, expire)
+
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self.__set_queue.put_nowait((key, value, expire, future))
+        return await future
+
+    async def __run_get_batches(self) -> None:
+        """
+        Reads keys in batches: TTL and value of every key are fetched by one pipeline.
+        """
+
+        while True:
+            batch: list[tuple[str, asyncio.Future[ttl_value]]] = []
+
+            try:
+                await self.__collect_batch(self.__get_queue, batch)
+                async with self.redis.pipeline(transaction=False) as pipe:
+                    for key, _ in batch:
+                        pipe.ttl(key).get(key)
+                    results: list[Any] = await pipe.execute()
+            except asyncio.CancelledError:
+                self.__requeue(self.__get_queue, batch)
+                raise
+            except Exception as e:
+                self.__fail_batch(batch, e)
+                continue
+
+            for i, (_, future) in enumerate(batch):
+                if not future.done():
+                    future.set_result((results[2 * i], results[2 * i + 1]))
+
+    async def __run_set_batches(self) -> None:
+        """
+        Writes keys in batches: every key is set with its own expiration time by one pipeline.
+        """
+
+        while True:
+            batch: list[tuple[str, str, Optional[int], asyncio.Future[None]]] = []
+
+            try:
+                await self.__collect_batch(self.__set_queue, batch)
+                async with self.redis.pipeline(transaction=False) as pipe:
+                    for key, value, expire, _ in batch:
+                        pipe.set(key, value, ex=expire)
+                    await pipe.execute()
+            except asyncio.CancelledError:
+                self.__requeue(self.__set_queue, batch)
+                raise
+            except Exception as e:
+                self.__fail_batch(batch, e)
+                continue
+
+            for *_, future in batch:
+                if not future.done():
+                    future.set_result(None)
+
+    async def __collect_batch(self, queue: asyncio.Queue[Any], batch: list[Any]) -> None:
+        """
+        Waits for the first item of queue, then for batching window, and moves up to batch size items to batch.
+
+        Items are moved to batch as soon as they are taken, so they are not lost if collecting is cancelled.
+
+        :param queue: queue to be drained.
+        :param batch: list the items are moved to.
+        """
+
+        batch.append(await queue.get())
+
+        if queue.qsize() < self.__batch_size - 1:
+            await asyncio.sleep(self.__batch_window)
+
+        while len(batch) < self.__batch_size and not queue.empty():
+            batch.append(queue.get_nowait())
+
+    @staticmethod
+    def __requeue(queue: asyncio.Queue[Any], batch: list[Any]) -> None:
+        """
+        Returns requests of interrupted batch to queue, unless they are already completed.
+
+        :param queue: queue the batch was taken from.
+        :param batch: batch of requests, the last element of each request is its future.
+        """
+
+        for request in batch:
+            if not request[-1].done():
+                queue.put_nowait(request)
+
+    @staticmethod
+    def __drain(queue: asyncio.Queue[Any]) -> list[Any]:
+        """
+        Takes all requests from queue, except already completed ones (for example, cancelled by caller).
+
+        :param queue: queue to be drained.
+        """
+
+        requests: list[Any] = []
+        while not queue.empty():
+            request = queue.get_nowait()
+            if not request[-1].done():
+                requests.append(request)
+        return requests
+
+    @staticmethod
+    async def __complete(future: asyncio.Future[Any], command: Awaitable[Any]) -> None:
+        """
+        Sends command to Redis and passes its result or exception to future.
+
+        :param future: future of request.
+        :param command: Redis command of request.
+        """
+
+        try:
+            result = await command
+        except Exception as e:
+            if not future.done():
+                future.set_exception(e)
+        else:
+            if not future.done():
+                future.set_result(result)
+
+    def __fail_batch(self, batch: list[Any], e: Exception) -> None:
+        """
+        Passes exception to every request of batch.
+
+        :param batch: batch of requests, the last element of each request is its future.
+        :param e: exception raised by Redis.
+        """
+
+        self.__logger.warning('Redis pipeline of %s commands failed: %s', len(batch), e)
+        for *_, future in batch:
+            if not future.done():
+                future.set_exception(e)
@@ -0,0 +1,64 @@
+from contextvars import ContextVar
+from functools import wraps
+from typing import Any, Awaitable, Callable, Optional, TypeVar
+
+from fastapi_cache.decorator import cache
+from starlette.responses import Response
+
+R = TypeVar('R')
+
+# Expiration time chosen for the result of the endpoint call that is being cached in the current context
+_expire_override: ContextVar[Optional[int]] = ContextVar('expire_override', default=None)
+
+
+def effective_expire(expire: Optional[int]) -> Optional[int]:
+    """
+    Returns expiration time, with which value should be stored in cache.
+
+    :param expire: expiration time requested by :func:`cache`.
+    """
+
+    override: Optional[int] = _expire_override.get()
+    return expire if override is None else override
+
+
+def cache_with_dynamic_expire(
+        expire: int,
+        expire_for: Callable[[Any], Optional[int]],
+) -> Callable[[Callable[..., Awaitable[R]]], Callable[..., Awaitable[R]]]:
+    """
+    Caches endpoint like :func:`cache`, but chooses expiration time by result of every call of the endpoint.
+
+    Backends have to pass expiration time through :func:`effective_expire` to respect it.
+
+    :param expire: time in seconds for which results are stored by default.
+    :param expire_for: function returning time in seconds for which result of the endpoint is stored
+                       (None if by default).
+    """
+
+    def wrapper(func: Callable[..., Awaitable[R]]) -> Callable[..., Awaitable[R]]:
+        @wraps(func)
+        async def choose_expire(*args: Any, **kwargs: Any) -> R:
+            result: R = await func(*args, **kwargs)
+            _expire_override.set(expire_for(result))
+            return result
+
+        cached: Callable[..., Awaitable[R]] = cache(expire=expire)(choose_expire)
+
+        @wraps(cached)
+        async def inner(*args: Any, **kwargs: Any) -> R:
+            token = _expire_override.set(None)
+            try:
+                result: R = await cached(*args, **kwargs)
+
+                override: Optional[int] = _expire_override.get()
+                response: Optional[Response] = kwargs.get('response')
+                if override is not None and response is not None and 'cache-control' in response.headers:
+                    response.headers['Cache-Control'] = f'max-age={override}'
+                return result
+            finally:
+                _expire_override.reset(token)
+
+        return inner
+
+    return wrapper
@@ -0,0 +1,65 @@
+import time
+from typing import Optional, Tuple
+
+from cachetools import TLRUCache
+from fastapi_cache.backends import Backend
+
+from .dynamic_expire import effective_expire
+
+
+class LocalCachedBackend(Backend):
+    """
+    Class represents :class:`Backend` that keeps recently used values in process memory in front of another backend.
+
+    Values are kept locally no longer than the given TTL and no longer than they live in the underlying backend.
+    Expiration time of values can be chosen by :func:`~caching.dynamic_expire.cache_with_dynamic_expire`.
+    """
+
+    __backend: Backend
+    __ttl: int
+    __values: TLRUCache[str, tuple[str, float]]
+
+    def __init__(self, backend: Backend, maxsize: int, ttl: int):
+        self.__backend = backend
+        self.__ttl = ttl
+        self.__values = TLRUCache(maxsize=maxsize, ttu=lambda _key, item, _now: item[1], timer=time.monotonic)
+
+    async def get_with_ttl(self, key: str) -> Tuple[int, Optional[str]]:
+        item: Optional[tuple[str, float]] = self.__values.get(key)
+        if item is not None:
+            value, deadline = item
+            return int(deadline - time.monotonic()), value
+
+        ttl, value = await self.__backend.get_with_ttl(key)
+        if value is not None:
+            self.__remember(key, value, ttl)
+        return ttl, value
+
+    async def get(self, key: str) -> Optional[str]:
+        _, value = await self.get_with_ttl(key)
+        return value
+
+    async def set(self, key: str, value: str, expire: Optional[int] = None) -> None:
+        expire = effective_expire(expire)
+        self.__remember(key, value, expire)
+        await self.__backend.set(key, value, expire)
+
+    async def clear(self, namespace: Optional[str] = None, key: Optional[str] = None) -> int:
+        if namespace:
+            self.__values.clear()
+        elif key:
+            self.__values.pop(key, None)
+        return await self.__backend.clear(namespace, key)
+
+    def __remember(self, key: str, value: str, expire: Optional[int]) -> None:
+        """
+        Stores value in process memory.
+
+        :param key: key of value.
+        :param value: value to be stored.
+        :param expire: time in seconds for which value is stored in the underlying backend (None or negative if forever).
+        """
+
+        ttl: int = self.__ttl if expire is None or expire < 0 else min(expire, self.__ttl)
+        if ttl > 0:
+            self.__values[key] = (value, time.monotonic() + ttl)
@@ -0,0 +1,38 @@
+from typing import Any
+
+import orjson
+import zstandard
+from fastapi.encoders import jsonable_encoder
+from fastapi_cache.coder import Coder
+from pydantic import BaseModel
+
+
+class ORJSONCoder(Coder):
+    """
+    Class represents :class:`Coder` that stores values in cache as JSON serialized by orjson.
+
+    Models are serialized by pydantic itself, other values fall back to :func:`jsonable_encoder`.
+    Values larger than :attr:`compression_threshold` bytes are compressed by zstd. Compressed values are
+    recognized by zstd frame header, which can't start JSON, so uncompressed values are stored as is.
+    """
+
+    compression_threshold: int = 4096
+    __compressor = zstandard.ZstdCompressor(level=3)
+    __decompressor = zstandard.ZstdDecompressor()
+
+    @classmethod
+    def encode(cls, value: Any) -> bytes:
+        if isinstance(value, BaseModel):
+            encoded: bytes = value.model_dump_json().encode()
+        else:
+            encoded = orjson.dumps(value, default=jsonable_encoder)
+
+        if len(encoded) > cls.compression_threshold:
+            return cls.__compressor.compress(encoded)
+        return encoded
+
+    @classmethod
+    def decode(cls, value: bytes) -> Any:
+        if value.startswith(zstandard.FRAME_HEADER):
+            value = cls.__decompressor.decompress(value)
+        return orjson.loads(value)
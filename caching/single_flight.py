@@ -0,0 +1,37 @@
+import asyncio
+from functools import wraps
+from typing import Any, Awaitable, Callable, Hashable, Optional, TypeVar
+from weakref import WeakValueDictionary
+
+from starlette.requests import Request
+from starlette.responses import Response
+
+R = TypeVar('R')
+
+
+def single_flight(func: Callable[..., Awaitable[R]]) -> Callable[..., Awaitable[R]]:
+    """
+    Serializes concurrent calls of endpoint with equal query parameters.
+
+    Placed in front of cached endpoint, it makes simultaneous cache misses for the same key result in one call
+    of the endpoint: the rest of callers wait for it and then find the value in cache.
+
+    :param func: endpoint to be wrapped (receives its parameters as keyword arguments).
+    """
+
+    locks: WeakValueDictionary[Hashable, asyncio.Lock] = WeakValueDictionary()
+
+    @wraps(func)
+    async def inner(*args: Any, **kwargs: Any) -> R:
+        key: Hashable = tuple(
+            (name, value) for name, value in kwargs.items() if not isinstance(value, (Request, Response))
+        )
+
+        lock: Optional[asyncio.Lock] = locks.get(key)
+        if lock is None:
+            lock = locks[key] = asyncio.Lock()
+
+        async with lock:
+            return await func(*args, **kwargs)
+
+    return inner
@@ -0,0 +1,52 @@
+import logging.config
+import logging.handlers
+import queue
+from typing import Any
+
+LOGGING: dict[str, Any] = {
+    'version': 1,
+    'formatters': {
+        'loggerFormatter': {
+            'format': '[%(asctime)s] [%(name)s] [%(levelname)s] > %(message)s',
+            'datefmt': '%Y-%m-%d %H:%M:%S',
+        },
+    },
+    'handlers': {
+        'StreamHandler': {
+            'class': 'logging.StreamHandler',
+            'level': 'DEBUG',
+            'formatter': 'loggerFormatter',
+        },
+    },
+    'loggers': {
+        'logger': {
+            'level': 'DEBUG',
+            'handlers': ['StreamHandler'],
+            'propagate': False,
+        },
+    },
+    'root': {
+        'level': 'DEBUG',
+        'handlers': ['StreamHandler'],
+    },
+}
+
+log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+log_listener = logging.handlers.QueueListener(log_queue, respect_handler_level=True)
+
+
+def setup_logging() -> None:
+    """
+    Configures logging by :data:`LOGGING` unless root logger is already configured (so it's done once per process).
+
+    Configured handlers of root logger are moved to :data:`log_listener`, which writes records in a separate
+    thread, so logging doesn't block event loop. The listener must be started to get records written.
+    """
+
+    root_logger: logging.Logger = logging.getLogger()
+    if root_logger.hasHandlers():
+        return
+
+    logging.config.dictConfig(LOGGING)
+    log_listener.handlers = tuple(root_logger.handlers)
+    root_logger.handlers = [logging.handlers.QueueHandler(log_queue)]
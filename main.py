@@ -1,78 +1,185 @@
-import logging.config
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
 from http import HTTPStatus
-from typing import Optional
+from typing import Annotated, AsyncIterator, Awaitable, Optional, TypeVar
 
 import starlette.datastructures
 import starlette.middleware.base
-from fastapi import FastAPI
+import uvicorn
+from fastapi import FastAPI, Query
+from fastapi.responses import ORJSONResponse
 from fastapi_cache import FastAPICache
-from fastapi_cache.backends.redis import RedisBackend
-from fastapi_cache.decorator import cache
-from redis.asyncio import Redis, from_url as redis_from_url
+from redis.asyncio import BlockingConnectionPool, Redis
 from starlette.requests import Request
 
+from caching import BatchedRedisBackend, LocalCachedBackend, ORJSONCoder, cache_with_dynamic_expire, single_flight
+from log_config import log_listener, setup_logging
 from model import Concert, TrackList
 from response import ResponseCode, TrackListResponse, ConcertsResponse, ResponseStatus
-from services import NotFoundException, InternalServiceErrorException
-from services import YandexMusicService
-from settings import settings
+from services import NotFoundException, InternalServiceErrorException, YandexMusicService
+from settings import Settings, get_settings
 
-logging.config.fileConfig(fname='logging.ini')
+settings: Settings = get_settings()
+
+setup_logging()
 root_logger = logging.getLogger('root')
 service_logger: logging.Logger = logging.getLogger('service')
 controller_logger: logging.Logger = logging.getLogger('controller')
-
-yandex_music_service = YandexMusicService(service_logger)
-redis: Redis = redis_from_url(
-    f'redis://:{settings.redis_password}@{settings.redis_host}:{settings.redis_port}'
+cache_logger: logging.Logger = logging.getLogger('cache')
+
+yandex_music_service = YandexMusicService(
+    logger=service_logger,
+    connections_limit=max(8, settings.yandex_connections // settings.workers),
+    dns_cache_ttl=settings.yandex_dns_ttl,
+    keepalive_timeout=settings.yandex_keepalive_timeout,
+    request_timeout=settings.yandex_request_timeout,
+    artist_cache_size=settings.yandex_artist_cache_size,
+    artist_cache_ttl=settings.yandex_artist_cache_ttl,
+)
+yandex_music_semaphore = asyncio.Semaphore(settings.max_inflight_yandex)
+redis: Redis = Redis(connection_pool=BlockingConnectionPool.from_url(
+    f'redis://:{settings.redis_password}@{settings.redis_host}:{settings.redis_port}',
+    max_connections=settings.redis_pool_size,
+))
+redis_backend = BatchedRedisBackend(
+    redis=redis,
+    logger=cache_logger,
+    batch_size=settings.redis_batch_size,
+    batch_window_ms=settings.redis_batch_window_ms,
+    ttl_jitter=settings.cache_ttl_jitter,
 )
+cache_backend = LocalCachedBackend(
+    backend=redis_backend,
+    maxsize=settings.local_cache_size,
+    ttl=settings.local_cache_ttl,
+)
+
+
+T = TypeVar('T')
+
+
+async def limit_yandex_music_calls(call: Awaitable[T]) -> T:
+    """
+    Awaits call of Yandex Music service, while number of concurrent calls is limited by :data:`yandex_music_semaphore`.
+
+    :param call: call of Yandex Music service.
+    """
+
+    async with yandex_music_semaphore:
+        return await call
+
+
+def log_return_success(url: str) -> None:
+    controller_logger.info('Returning SUCCESS for %s', url)
+
+
+def log_return_error(url: str, code: ResponseCode, message: str) -> None:
+    controller_logger.info('Returning %d - "%s" for %s', code, message, url)
+
+
+# Responses with constant error status are built once and shared (they are never modified)
+INTERNAL_ERROR_MESSAGE = 'Internal service error'
+INTERNAL_ERROR_STATUS = ResponseStatus(code=ResponseCode.INTERNAL_ERROR, message=INTERNAL_ERROR_MESSAGE)
+CONCERTS_INTERNAL_ERROR_RESPONSE = ConcertsResponse(status=INTERNAL_ERROR_STATUS)
+TRACK_LIST_INTERNAL_ERROR_RESPONSE = TrackListResponse(status=INTERNAL_ERROR_STATUS)
+
+# Links to playlists and albums of Yandex Music, other links are rejected before reaching the service
+TRACK_LIST_URL_PATTERN = r'^(https?://)?music\.yandex\.[a-z]+(\.[a-z]+)?/(users/\S+/playlists|album)/\S+$'
+
+
+def concerts_expire(response: ConcertsResponse) -> Optional[int]:
+    """
+    Returns time in seconds for which response about concerts is cached (None if by default).
+
+    Concerts are cached for longer, while the nearest of them is far ahead. Not found artists and errors
+    are cached shortly, so they are retried soon.
 
+    :param response: response about concerts.
+    """
 
-def log_return_success(url: starlette.datastructures.URL) -> None:
-    controller_logger.info(f'Returning SUCCESS for {url}')
+    if response.status.code in (ResponseCode.ARTIST_NOT_FOUND, ResponseCode.INTERNAL_ERROR):
+        return settings.negative_cache_ttl
+    if not response.concerts:
+        return None
 
+    nearest_concert: datetime = min(concert.datetime for concert in response.concerts)
+    if nearest_concert - datetime.now(timezone.utc) < timedelta(seconds=settings.imminent_concert_period):
+        return None
+    return settings.distant_concerts_expiration_time
 
-def log_return_error(url: starlette.datastructures.URL, status: ResponseStatus) -> None:
-    controller_logger.info(f'Returning {status.code} - "{status.message}" for {url}')
+
+def track_list_expire(response: TrackListResponse) -> Optional[int]:
+    """
+    Returns time in seconds for which response about track list is cached (None if by default).
+
+    Not found track lists and errors are cached shortly, so they are retried soon.
+
+    :param response: response about track list.
+    """
+
+    if response.status.code in (ResponseCode.TRACK_LIST_NOT_FOUND, ResponseCode.INTERNAL_ERROR):
+        return settings.negative_cache_ttl
+    return None
+
+async def check_redis_connection() -> None:
+    try:
+        root_logger.info('Checking connection with redis ...')
+        await asyncio.wait_for(redis.ping(), timeout=settings.redis_ping_timeout)  # Check redis connection and auth
+        root_logger.info('Connection with Redis is OK')
+    except Exception as e:
+        root_logger.warning('Failed to establish connection with redis : %r', e)
 
 
 async def startup() -> None:
     root_logger.info('Application is launching ...')
-    await yandex_music_service.setup()
+    root_logger.info('Event loop is %s', type(asyncio.get_running_loop()).__module__)
 
     # If connection fail, server will continue working, but without caching
     root_logger.info('Initializing redis-backend ...')
-    FastAPICache.init(RedisBackend(redis), prefix="fastapi-cache")
+    FastAPICache.init(cache_backend, prefix="fastapi-cache", coder=ORJSONCoder)
+    redis_backend.start()
     root_logger.info('Redis-backend is initialized')
 
-    try:
-        root_logger.info('Checking connection with redis ...')
-        await redis.ping()  # Check redis connection and auth
-        root_logger.info('Connection with Redis is OK')
-    except Exception as e:
-        root_logger.warning('Failed to establish connection with redis : %s', e)
+    await asyncio.gather(yandex_music_service.setup(), check_redis_connection())
+
+
+async def close_redis() -> None:
+    await redis_backend.stop()
+    await redis.close(close_connection_pool=True)
 
 
 async def shutdown() -> None:
     root_logger.critical('Application is shutting down ...')
-    await yandex_music_service.terminate()
-    await redis.close()
+    await asyncio.gather(yandex_music_service.terminate(), close_redis())
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    log_listener.start()
+    await startup()
+    yield
+    await shutdown()
+    log_listener.stop()
 
 
 app: FastAPI = FastAPI(
-    on_startup=[startup],
-    on_shutdown=[shutdown],
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 
 @app.middleware('http')
 async def log_middleware(request: Request, call_next):
     client: Optional[starlette.datastructures.Address] = request.client
+    url: str = str(request.url)
+    request.state.url = url
 
     controller_logger.info(
-        f'Received %s %s from %s:%s',
+        'Received %s %s from %s:%s',
         request.method,
-        request.url,
+        url,
         None if client is None else client.host,
         None if client is None else client.port,
     )
@@ -80,56 +187,61 @@ async def log_middleware(request: Request, call_next):
     result = await call_next(request)
 
     if result.status_code == HTTPStatus.NOT_MODIFIED:
-        controller_logger.info(f'Returning response from cache for {request.url}')
+        controller_logger.info('Returning response from cache for %s', url)
 
     return result
 
 
-@app.get('/concerts')
-@cache(expire=settings.concerts_expiration_time)
-async def get_concerts(request: Request, artist_id: int) -> ConcertsResponse:
-    request_url: starlette.datastructures.URL = request.url
-    status: ResponseStatus
+@app.get('/concerts', response_model=ConcertsResponse)
+@single_flight
+@cache_with_dynamic_expire(expire=settings.concerts_expiration_time, expire_for=concerts_expire)
+async def get_concerts(
+        request: Request,
+        artist_id: Annotated[int, Query(ge=1, lt=1 << 31)],
+) -> ConcertsResponse:
+    request_url: str = request.state.url
 
     try:
-        concerts: list[Concert] = await yandex_music_service.parse_concerts(artist_id)
+        concerts: list[Concert] = await limit_yandex_music_calls(yandex_music_service.parse_concerts(artist_id))
         log_return_success(request_url)
         return ConcertsResponse(concerts=concerts)
     except NotFoundException:
-        status = ResponseStatus(
-            code=ResponseCode.ARTIST_NOT_FOUND,
-            message=f'Artist {artist_id} not found',
-        )
+        message: str = f'Artist {artist_id} not found'
+        log_return_error(url=request_url, code=ResponseCode.ARTIST_NOT_FOUND, message=message)
+        return ConcertsResponse(status=ResponseStatus(code=ResponseCode.ARTIST_NOT_FOUND, message=message))
     except InternalServiceErrorException:
-        status = ResponseStatus(
-            code=ResponseCode.ARTIST_NOT_FOUND,
-            message='Internal service error',
-        )
-
-    log_return_error(url=request_url, status=status)
-    return ConcertsResponse(status=status)
+        log_return_error(url=request_url, code=ResponseCode.INTERNAL_ERROR, message=INTERNAL_ERROR_MESSAGE)
+        return CONCERTS_INTERNAL_ERROR_RESPONSE
 
 
-@app.get('/track-lists')
-@cache(expire=settings.track_lists_expiration_time)
-async def get_tracks_list_info(request: Request, url: str) -> TrackListResponse:
-    request_url: starlette.datastructures.URL = request.url
-    status: ResponseStatus
+@app.get('/track-lists', response_model=TrackListResponse)
+@single_flight
+@cache_with_dynamic_expire(expire=settings.track_lists_expiration_time, expire_for=track_list_expire)
+async def get_tracks_list_info(
+        request: Request,
+        url: Annotated[str, Query(pattern=TRACK_LIST_URL_PATTERN, max_length=512)],
+) -> TrackListResponse:
+    request_url: str = request.state.url
 
     try:
-        track_list: TrackList = await yandex_music_service.parse_track_list(url)
+        track_list: TrackList = await limit_yandex_music_calls(yandex_music_service.parse_track_list(url))
         log_return_success(request_url)
         return TrackListResponse(track_list=track_list)
     except NotFoundException:
-        status = ResponseStatus(
-            code=ResponseCode.TRACK_LIST_NOT_FOUND,
-            message=f'Track list {url} not found',
-        )
+        message: str = f'Track list {url} not found'
+        log_return_error(url=request_url, code=ResponseCode.TRACK_LIST_NOT_FOUND, message=message)
+        return TrackListResponse(status=ResponseStatus(code=ResponseCode.TRACK_LIST_NOT_FOUND, message=message))
     except InternalServiceErrorException:
-        status = ResponseStatus(
-            code=ResponseCode.INTERNAL_ERROR,
-            message='Internal service error',
-        )
-
-    log_return_error(url=request_url, status=status)
-    return TrackListResponse(status=status)
+        log_return_error(url=request_url, code=ResponseCode.INTERNAL_ERROR, message=INTERNAL_ERROR_MESSAGE)
+        return TRACK_LIST_INTERNAL_ERROR_RESPONSE
+
+
+if __name__ == '__main__':
+    uvicorn.run(
+        'main:app',
+        host=settings.host,
+        port=settings.port,
+        workers=settings.workers,
+        loop='uvloop',
+        http='httptools',
+    )
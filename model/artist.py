@@ -1,9 +1,8 @@
-from pydantic import BaseModel, Field
+from pydantic import Field
+from pydantic.dataclasses import dataclass
 
 
-class Artist(BaseModel):
+@dataclass(frozen=True, slots=True)
+class Artist:
     name: str = Field(min_length=1)
     yandex_music_id: int = Field(ge=0)
-
-    class Config:
-        frozen = True
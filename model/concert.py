@@ -18,3 +18,7 @@ class Concert(BaseModel):
     images: list[str]
     min_price: Optional[Price] = None
     artists: list[Artist] = Field(min_length=1)
+
+    class Config:
+        frozen = True
+        extra = 'forbid'
@@ -10,3 +10,7 @@ class TrackList(BaseModel):
     title: str = Field(min_length=1)
     image: Optional[str] = None
     artists: list[Artist]
+
+    class Config:
+        frozen = True
+        extra = 'forbid'
@@ -3,9 +3,9 @@ from typing import Optional
 from pydantic import BaseModel
 
 from model import Concert
-from .response_status import ResponseStatus
+from .response_status import ResponseStatus, OK_STATUS
 
 
 class ConcertsResponse(BaseModel):
-    status: ResponseStatus = ResponseStatus()
+    status: ResponseStatus = OK_STATUS
     concerts: Optional[list[Concert]] = None
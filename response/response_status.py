@@ -2,11 +2,19 @@ from pydantic import BaseModel, Field
 
 from .response_code import ResponseCode
 
+CODE_DESCRIPTION: str = ', '.join(f'{code.value} - {code.name}' for code in ResponseCode)
+
 
 class ResponseStatus(BaseModel):
     code: ResponseCode = Field(
         default=ResponseCode.SUCCESS,
-        description=''.join([f'{i} - {ResponseCode(i).name}, ' for i in range(len(ResponseCode))])
+        description=CODE_DESCRIPTION
     )
 
     message: str = ResponseCode.SUCCESS.name
+
+    class Config:
+        frozen = True
+
+
+OK_STATUS = ResponseStatus()
@@ -3,9 +3,9 @@ from typing import Optional
 from pydantic import BaseModel
 
 from model import TrackList
-from .response_status import ResponseStatus
+from .response_status import ResponseStatus, OK_STATUS
 
 
 class TrackListResponse(BaseModel):
-    status: ResponseStatus = ResponseStatus()
+    status: ResponseStatus = OK_STATUS
     track_list: Optional[TrackList] = None
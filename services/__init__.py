@@ -1,8 +1,8 @@
 __all__ = [
-    'YandexMusicService',
     'ServiceException',
     'NotFoundException',
-    'InternalServiceErrorException'
+    'InternalServiceErrorException',
+    'YandexMusicService'
 ]
 
 from .exceptions import ServiceException, NotFoundException, InternalServiceErrorException
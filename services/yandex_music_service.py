@@ -1,49 +1,198 @@
-import json
+import asyncio
+import random
 import re
+import sys
 from datetime import datetime
+from functools import lru_cache
+from itertools import repeat
+from http import HTTPStatus
 from logging import Logger
-from typing import Optional, Any
+from typing import Optional, Any, Callable, Iterable, Union
+from weakref import WeakValueDictionary
 
 import aiohttp
+import orjson
+from cachetools import TTLCache
 
 from model import Concert, Price, Artist, TrackList
 from .exceptions import NotFoundException, InternalServiceErrorException
 
 str_dict = dict[str, Any]
 
+# Path of playlist/album at the end of its url (searched, so anything may precede it)
+TRACK_LIST_URL_PATTERN: re.Pattern[str] = re.compile(
+    r'/(?:users/(?P<user_id>[^/]+)/playlists/(?P<playlist_id>[^/]+)|album/(?P<album_id>[^/]+))/?$'
+)
 
-def get_dict_value(d: dict[Any, Any], key: Any) -> Any:
+
+def split_track_list_url(url: str) -> Optional[dict[str, Optional[str]]]:
+    """
+    Returns ids of playlist ("user_id" and "playlist_id") or album ("album_id") from its url.
+    Returns None if url is not url of playlist/album.
+
+    Urls ending with path of playlist/album are split by slashes, other urls are searched
+    by :data:`TRACK_LIST_URL_PATTERN` (unless they can't contain path of playlist/album at all).
+
+    :param url: url of playlist/album.
+    """
+
+    parts: list[str] = (url[:-1] if url.endswith('/') else url).rsplit('/', 4)
+
+    if len(parts) == 5 and parts[1] == 'users' and parts[3] == 'playlists' and parts[2] and parts[4]:
+        return {'user_id': parts[2], 'playlist_id': parts[4], 'album_id': None}
+    if len(parts) >= 3 and parts[-2] == 'album' and parts[-1]:
+        return {'user_id': None, 'playlist_id': None, 'album_id': parts[-1]}
+
+    if '/playlists/' not in url and '/album/' not in url:
+        return None
+    match: Optional[re.Match[str]] = TRACK_LIST_URL_PATTERN.search(url)
+    return None if match is None else match.groupdict()
+
+
+def parse_datetime(value: str) -> datetime:
+    """
+    Parses datetime in ISO 8601 format, as it's returned by Yandex Music API (for example, 2024-05-01T19:00:00+0300).
+
+    Before Python 3.11 :meth:`datetime.fromisoformat` accepts neither UTC offset without colon nor ``Z``,
+    so they are converted.
+
+    :param value: datetime in ISO 8601 format with UTC offset.
+    :raises ValueError: value is not datetime in ISO 8601 format or has no UTC offset.
+    """
+
+    if sys.version_info < (3, 11):
+        if value.endswith('Z'):
+            value = f'{value[:-1]}+00:00'
+        elif len(value) > 5 and value[-5] in '+-':
+            value = f'{value[:-2]}:{value[-2:]}'
+
+    result: datetime = datetime.fromisoformat(value)
+    if result.tzinfo is None:
+        raise ValueError(f'Datetime {value} has no UTC offset')
+    return result
+
+
+def extract_concert(concert: str_dict, artist: Artist) -> Concert:
+    """
+    Extracts :class:`Concert` from Yandex Music API JSON-dictionary of concert.
+
+    :param concert: Yandex Music API JSON-dictionary of concert.
+    :param artist: artist performing on the concert.
+    :raises KeyError: Yandex Music API JSON-dictionary doesn't have all required keys.
+    """
+
+    get = concert.get
+
+    concert_images: Optional[list[str]] = get('images')
+
+    concert_min_price_dict: Optional[str_dict] = get('minPrice')
+    min_price: Optional[Price] = None
+    if concert_min_price_dict:
+        min_price = Price(
+            price=int(concert_min_price_dict['value']),
+            currency=concert_min_price_dict['currency']
+        )
+
+    return Concert(
+        title=concert['concertTitle'],
+        afisha_url=concert['afishaUrl'],
+        city=concert['city'],
+        place=get('place'),
+        address=concert['address'],
+        datetime=parse_datetime(concert['datetime']),
+        map_url=get('mapUrl'),
+        images=concert_images if concert_images is not None else [],
+        min_price=min_price,
+        artists=[artist]
+    )
+
+
+def extract_artist(artist: str_dict) -> Artist:
+    """
+    Extracts :class:`Artist` from Yandex Music API JSON-dictionary of artist.
+
+    :param artist: Yandex Music API JSON-dictionary of artist.
+    :raises KeyError: Yandex Music API JSON-dictionary doesn't have all required keys.
+    """
+
+    return Artist(
+        name=artist['name'],
+        yandex_music_id=artist['id']
+    )
+
+
+def extract_unique_artists(artists: Iterable[str_dict]) -> list[Artist]:
+    """
+    Extracts :class:`Artist` once per id from Yandex Music API JSON-dictionaries of artists in a single pass.
+    Artists are returned in order of their first appearance.
+
+    :param artists: Yandex Music API JSON-dictionaries of artists (possibly repeated).
+    :raises KeyError: Yandex Music API JSON-dictionary doesn't have all required keys.
+    """
+
+    result: dict[int, Artist] = {}
+    for a in artists:
+        artist_id: int = a['id']
+        if artist_id not in result:
+            result[artist_id] = extract_artist(a)
+    return list(result.values())
+
+
+def extract_playlist(url: str, playlist: str_dict) -> TrackList:
     """
-    Returns value from dictionary by key.
+    Extracts :class:`TrackList` from Yandex Music API JSON-dictionary of playlist.
 
-    :param d: dictionary.
-    :param key: key of dictionary.
-    :raises KeyError: the key is not presented in dictionary.
+    :param url: url of playlist (passed just to be put to :class:`TrackList`).
+    :param playlist: Yandex Music API JSON-dictionary of playlist.
+    :raises KeyError: Yandex Music API JSON-dictionary doesn't have all required keys.
     """
 
-    return d[key]
+    artists: list[Artist] = extract_unique_artists(
+        a for short_track in playlist['tracks'] for a in short_track['track']['artists']
+    )
+    cover_uri: Optional[str] = playlist.get('ogImage')
+
+    return TrackList(
+        url=url,
+        title=playlist['title'],
+        image=get_cover_link(cover_uri),
+        artists=artists
+    )
 
 
-def get_dict_value_or_none(d: dict[Any, Any], key: Any) -> Any:
+def extract_album(url: str, album: str_dict) -> TrackList:
     """
-    Returns value from dictionary by key or None if the key is not presented in dictionary.
+    Extracts :class:`TrackList` from Yandex Music API JSON-dictionary of album.
 
-    :param d: dictionary.
-    :param key: key of dictionary.
+    :param url: url of album (passed just to be put to :class:`TrackList`).
+    :param album: Yandex Music API JSON-dictionary of album.
+    :raises KeyError: Yandex Music API JSON-dictionary doesn't have all required keys.
     """
 
-    return d.get(key)
+    artists: list[Artist] = extract_unique_artists(album['artists'])
+    cover_uri: Optional[str] = album.get('ogImage')
 
+    return TrackList(
+        url=url,
+        title=album['title'],
+        image=get_cover_link(cover_uri),
+        artists=artists
+    )
 
-def contains_key(d: dict[Any, Any], key: Any) -> bool:
+
+@lru_cache(maxsize=1024)
+def get_cover_link(abstract_uri: Optional[str]) -> Optional[str]:
     """
-    Returns whether dictionary contains key.
+    Returns url of album/playlist link with size 400x400. Links of popular covers are cached.
+
+    Example of abstract_uri:
+
+    avatars.yandex.net/get-music-content/5966316/a134df77.a.23033323-1/%%
 
-    :param d: dictionary.
-    :param key: key of dictionary.
+    :param abstract_uri: abstract url of album/playlist cover.
     """
 
-    return d.get(key) is not None
+    return None if abstract_uri is None else f'https://{abstract_uri[:-2]}400x400'
 
 
 class YandexMusicService:
@@ -54,12 +203,55 @@ class YandexMusicService:
     __user_agent = "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/128.0.6613.648 YaBrowser/24.10.4.648 (beta) Yowser/2.5 Safari/537.36"
     __session: aiohttp.ClientSession
     __base_url: str = 'https://api.music.yandex.net'
-    __playlist_url_pattern: re.Pattern[str] = re.compile(r'^.*/users/(\S+)/playlists/(\S+)$')
-    __album_url_pattern: re.Pattern[str] = re.compile(r'^.*/album/(\S+)$')
+    # URIs of Yandex Music API are built by bound format methods of templates
+    __artist_brief_info_api_uri: Callable[..., str] = '/artists/{artist_id}/brief-info'.format
+    __playlist_api_uri: Callable[..., str] = '/users/{user_id}/playlists/{playlist_id}'.format
+    __album_api_uri: Callable[..., str] = '/albums/{album_id}'.format
+    __retried_statuses: frozenset[int] = frozenset({
+        HTTPStatus.TOO_MANY_REQUESTS,
+        HTTPStatus.INTERNAL_SERVER_ERROR,
+        HTTPStatus.BAD_GATEWAY,
+        HTTPStatus.SERVICE_UNAVAILABLE,
+        HTTPStatus.GATEWAY_TIMEOUT,
+    })
+    __max_attempts: int = 4
+    __retry_base_delay: float = 0.1
+    __max_retry_delay: float = 5.0
     __logger: Logger
+    __connections_limit: int
+    __dns_cache_ttl: int
+    __keepalive_timeout: float
+    __request_timeout: float
+    __artist_data_cache: TTLCache[int, str_dict]
+    __artist_data_locks: WeakValueDictionary[int, asyncio.Lock]
+
+    def __init__(
+            self,
+            logger: Logger,
+            connections_limit: int,
+            dns_cache_ttl: int,
+            keepalive_timeout: float,
+            request_timeout: float,
+            artist_cache_size: int,
+            artist_cache_ttl: int
+    ):
+        """
+        :param logger: logger of service.
+        :param connections_limit: maximal number of simultaneous connections with Yandex Music API.
+        :param dns_cache_ttl: time in seconds for which resolved addresses of Yandex Music API are cached.
+        :param keepalive_timeout: time in seconds for which idle connections with Yandex Music API are kept open.
+        :param request_timeout: maximal time in seconds of one request to Yandex Music API.
+        :param artist_cache_size: maximal number of artists whose data from Yandex Music API is cached.
+        :param artist_cache_ttl: time in seconds for which data of artist from Yandex Music API is cached.
+        """
 
-    def __init__(self, logger: Logger):
         self.__logger = logger
+        self.__connections_limit = connections_limit
+        self.__dns_cache_ttl = dns_cache_ttl
+        self.__keepalive_timeout = keepalive_timeout
+        self.__request_timeout = request_timeout
+        self.__artist_data_cache = TTLCache(maxsize=artist_cache_size, ttl=artist_cache_ttl)
+        self.__artist_data_locks = WeakValueDictionary()
 
     async def setup(self) -> None:
         """
@@ -67,9 +259,21 @@ class YandexMusicService:
         """
 
         self.__logger.info('Setting up aiohttp-session with Yandex Music API ...')
-        self.__session = aiohttp.ClientSession(base_url=self.__base_url, headers={
-            "user-agent": self.__user_agent
-        })
+        connector = aiohttp.TCPConnector(
+            limit=self.__connections_limit,
+            limit_per_host=self.__connections_limit,
+            ttl_dns_cache=self.__dns_cache_ttl,
+            keepalive_timeout=self.__keepalive_timeout,
+            enable_cleanup_closed=True,
+        )
+        self.__session = aiohttp.ClientSession(
+            base_url=self.__base_url,
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=self.__request_timeout),
+            headers={
+                "user-agent": self.__user_agent
+            }
+        )
         self.__logger.info('aiohttp-session with Yandex Music API established')
 
     async def parse_track_list(self, track_list_url: str) -> TrackList:
@@ -81,26 +285,25 @@ class YandexMusicService:
         :raises InternalServiceErrorException: internal service error occurred.
         """
 
-        self.__logger.info(f'Parsing track list {track_list_url} ...')
+        self.__logger.info('Parsing track list %s ...', track_list_url)
 
-        playlist_match: Optional[re.Match[str]] = re.match(self.__playlist_url_pattern, track_list_url)
-        if playlist_match is not None:
-            return await self.__parse_playlist(
-                url=track_list_url,
-                user_id=playlist_match.group(1),
-                playlist_id=playlist_match.group(2)
-            )
+        track_list_ids: Optional[dict[str, Optional[str]]] = split_track_list_url(track_list_url)
+        if track_list_ids is None:
+            incorrect_url_message: str = f'Track list {track_list_url} has incorrect URL'
+            self.__logger.info(incorrect_url_message)
+            raise NotFoundException(incorrect_url_message)
 
-        album_math_match: Optional[re.Match[str]] = re.match(self.__album_url_pattern, track_list_url)
-        if album_math_match is not None:
-            return await self.__parse_album(
+        if track_list_ids['user_id'] is not None:
+            return await self.__parse_playlist(
                 url=track_list_url,
-                album_id=album_math_match.group(1)
+                user_id=track_list_ids['user_id'],
+                playlist_id=track_list_ids['playlist_id']
             )
 
-        incorrect_url_message: str = f'Track list {track_list_url} has incorrect URL'
-        self.__logger.info(incorrect_url_message)
-        raise NotFoundException(incorrect_url_message)
+        return await self.__parse_album(
+            url=track_list_url,
+            album_id=track_list_ids['album_id']
+        )
 
     async def parse_concerts(self, artist_id: int) -> list[Concert]:
         """
@@ -111,30 +314,78 @@ class YandexMusicService:
         :raises InternalServiceErrorException: internal service error occurred.
         """
 
-        self.__logger.info(f'Parsing concerts of artist {artist_id}. Fetching data from Yandex Music API ...')
+        self.__logger.info('Parsing concerts of artist %s ...', artist_id)
 
-        uri: str = self.__create_artist_brief_info_api_uri(artist_id)
-        not_found_message: str = f'Artist {artist_id} not found'
-        yandex_music_json: str_dict = await self.__fetch_artist_data(uri=uri, not_found_message=not_found_message)
-        self.__logger.info(f'Fetched data from Yandex Music API for artist {artist_id}')
-
-        try:
-            artist = self.__extract_artist(get_dict_value(yandex_music_json, "artist"))
-        except Exception as e:
-            message: str = f'Parsing artist {artist_id} failed'
-            self.__logger.warning(f'{message}: {str(e)}')
-            raise InternalServiceErrorException(message) from e
+        yandex_music_json: str_dict = await self.__get_artist_data(artist_id)
+        artist: Artist = self.__extract_artist_data(artist_id=artist_id, artist_data=yandex_music_json)
 
         try:
-            concerts: list[str_dict] = get_dict_value(yandex_music_json, 'concerts')
-            result: list[Concert] = [self.__extract_concert(c, artist) for c in concerts]
-            self.__logger.info(f'Parsing concerts of artist {artist_id} succeeded')
+            concerts: list[str_dict] = yandex_music_json['concerts']
+            result: list[Concert] = list(map(extract_concert, concerts, repeat(artist)))
+            self.__logger.info('Parsing concerts of artist %s succeeded', artist_id)
             return result
         except Exception as e:
             message: str = f'Parsing concerts of artist {artist_id} failed'
-            self.__logger.warning(f'{message}: {str(e)}')
+            self.__logger.warning('%s: %s', message, e)
             raise InternalServiceErrorException(message) from e
 
+    async def parse_artist(self, artist_id: int) -> Artist:
+        """
+        Parses artist from Yandex Music.
+
+        :param artist_id: id of artist on Yandex Music.
+        :raises NotFoundException: artist with this id on Yandex Music not found.
+        :raises InternalServiceErrorException: internal service error occurred.
+        """
+
+        self.__logger.info('Parsing artist %s ...', artist_id)
+
+        yandex_music_json: str_dict = await self.__get_artist_data(artist_id)
+        result: Artist = self.__extract_artist_data(artist_id=artist_id, artist_data=yandex_music_json)
+        self.__logger.info('Parsing artist %s succeeded', artist_id)
+        return result
+
+    async def parse_artist_full(self, artist_id: int) -> tuple[Artist, list[Concert]]:
+        """
+        Parses artist and its actual concerts from Yandex Music concurrently.
+
+        Both are parsed from the same data of artist, so Yandex Music API is requested at most once.
+
+        :param artist_id: id of artist on Yandex Music.
+        :raises NotFoundException: artist with this id on Yandex Music not found.
+        :raises InternalServiceErrorException: internal service error occurred.
+        """
+
+        artist, concerts = await asyncio.gather(self.parse_artist(artist_id), self.parse_concerts(artist_id))
+        return artist, concerts
+
+    async def parse_track_lists(self, track_list_urls: list[str]) -> list[Union[TrackList, BaseException]]:
+        """
+        Parses several playlists/albums of Yandex Music concurrently.
+
+        Returns results in the order of urls, each result is :class:`TrackList` or exception raised
+        by :meth:`parse_track_list` for its url.
+
+        :param track_list_urls: urls of playlists/albums of Yandex Music.
+        """
+
+        return await asyncio.gather(*(self.parse_track_list(url) for url in track_list_urls), return_exceptions=True)
+
+    async def parse_concerts_many(self, artist_ids: list[int]) -> list[Union[list[Concert], BaseException]]:
+        """
+        Parses actual concerts of several artists from Yandex Music concurrently.
+
+        Returns results in the order of ids, each result is list of :class:`Concert` or exception raised
+        by :meth:`parse_concerts` for its artist.
+
+        :param artist_ids: ids of artists on Yandex Music.
+        """
+
+        return await asyncio.gather(
+            *(self.parse_concerts(artist_id) for artist_id in artist_ids),
+            return_exceptions=True
+        )
+
     async def terminate(self) -> None:
         """
         Terminates service and frees all underlying resources.
@@ -155,9 +406,9 @@ class YandexMusicService:
         :raises InternalServiceErrorException: internal error occurred during parsing the playlist.
         """
 
-        self.__logger.info(f'Parsing playlist {url}. Fetching data from Yandex Music API ...')
+        self.__logger.info('Parsing playlist %s. Fetching data from Yandex Music API ...', url)
 
-        uri: str = self.__create_playlist_api_uri(user_id=user_id, playlist_id=playlist_id)
+        uri: str = self.__playlist_api_uri(user_id=user_id, playlist_id=playlist_id)
         not_found_message: str = f'Playlist {url} not found'
 
         yandex_music_api_data: str_dict = await self.__fetch_yandex_music_api_data(
@@ -165,15 +416,15 @@ class YandexMusicService:
             not_found_message=not_found_message
         )
 
-        self.__logger.info(f'Fetched data from Yandex Music API for playlist {url}')
+        self.__logger.info('Fetched data from Yandex Music API for playlist %s', url)
 
         try:
-            result: TrackList = self.__extract_playlist(url=url, playlist=yandex_music_api_data)
-            self.__logger.info(f'Parsing playlist {url} succeeded')
+            result: TrackList = extract_playlist(url=url, playlist=yandex_music_api_data)
+            self.__logger.info('Parsing playlist %s succeeded', url)
             return result
         except Exception as e:
             message: str = f'Parsing playlist {url} failed'
-            self.__logger.warning(f'{message}: {str(e)}')
+            self.__logger.warning('%s: %s', message, e)
             raise InternalServiceErrorException(message) from e
 
     async def __parse_album(self, url: str, album_id: str) -> TrackList:
@@ -186,9 +437,9 @@ class YandexMusicService:
         :raises InternalServiceErrorException: internal error occurred during parsing the album.
         """
 
-        self.__logger.info(f'Parsing album {url}. Fetching data from Yandex Music API ...')
+        self.__logger.info('Parsing album %s. Fetching data from Yandex Music API ...', url)
 
-        uri: str = self.__create_album_api_uri(album_id)
+        uri: str = self.__album_api_uri(album_id=album_id)
         not_found_message: str = f'Album {url} not found'
 
         yandex_music_api_data: str_dict = await self.__fetch_yandex_music_api_data(
@@ -196,22 +447,74 @@ class YandexMusicService:
             not_found_message=not_found_message
         )
 
-        self.__logger.info(f'Fetched data from Yandex Music API for album {url}')
+        self.__logger.info('Fetched data from Yandex Music API for album %s', url)
 
-        error: Optional[str_dict] = get_dict_value_or_none(yandex_music_api_data, 'error')
+        error: Optional[str_dict] = yandex_music_api_data.get('error')
         if error:
-            self.__logger.info(f'Fetched data from Yandex Music API for album {url} contains error: {str(error)}')
+            self.__logger.info('Fetched data from Yandex Music API for album %s contains error: %s', url, error)
             raise NotFoundException(not_found_message)
 
         try:
-            result: TrackList = self.__extract_album(url=url, album=yandex_music_api_data)
-            self.__logger.info(f'Parsing album {url} succeeded')
+            result: TrackList = extract_album(url=url, album=yandex_music_api_data)
+            self.__logger.info('Parsing album %s succeeded', url)
             return result
         except Exception as e:
             message: str = f'Parsing album {url} failed'
-            self.__logger.warning(f'{message}: {str(e)}')
+            self.__logger.warning('%s: %s', message, e)
             raise InternalServiceErrorException(message) from e
 
+    def __extract_artist_data(self, artist_id: int, artist_data: str_dict) -> Artist:
+        """
+        Extracts :class:`Artist` from Yandex Music API brief info of artist.
+
+        :param artist_id: id of artist on Yandex Music.
+        :param artist_data: brief info of artist from Yandex Music API.
+        :raises InternalServiceErrorException: brief info of artist is malformed.
+        """
+
+        try:
+            return extract_artist(artist_data['artist'])
+        except Exception as e:
+            message: str = f'Parsing artist {artist_id} failed'
+            self.__logger.warning('%s: %s', message, e)
+            raise InternalServiceErrorException(message) from e
+
+    async def __get_artist_data(self, artist_id: int) -> str_dict:
+        """
+        Returns brief info of artist from Yandex Music API, recently fetched data is taken from cache.
+
+        Concurrent calls for the same artist result in one request to Yandex Music API.
+
+        :param artist_id: id of artist on Yandex Music.
+        :raises NotFoundException: artist with this id on Yandex Music not found.
+        :raises InternalServiceErrorException: internal error occurred during fetching data.
+        """
+
+        result: Optional[str_dict] = self.__artist_data_cache.get(artist_id)
+        if result is not None:
+            self.__logger.info('Data of artist %s is taken from cache', artist_id)
+            return result
+
+        lock: Optional[asyncio.Lock] = self.__artist_data_locks.get(artist_id)
+        if lock is None:
+            lock = self.__artist_data_locks[artist_id] = asyncio.Lock()
+
+        async with lock:
+            result = self.__artist_data_cache.get(artist_id)
+            if result is not None:
+                self.__logger.info('Data of artist %s is taken from cache', artist_id)
+                return result
+
+            self.__logger.info('Fetching data of artist %s from Yandex Music API ...', artist_id)
+            result = await self.__fetch_artist_data(
+                uri=self.__artist_brief_info_api_uri(artist_id=artist_id),
+                not_found_message=f'Artist {artist_id} not found'
+            )
+            self.__logger.info('Fetched data from Yandex Music API for artist %s', artist_id)
+
+            self.__artist_data_cache[artist_id] = result
+            return result
+
     async def __fetch_artist_data(self, uri: str, not_found_message: str) -> str_dict:
         """
         Fetches data from Yandex Music API, checks whether response contains valid data of artist.
@@ -227,7 +530,7 @@ class YandexMusicService:
         :raises InternalServiceErrorException: internal error occurred during checking response.
         """
 
-        self.__logger.info(f'Fetching data of artist from {uri} ...')
+        self.__logger.info('Fetching data of artist from %s ...', uri)
 
         artist_key: str = 'artist'
 
@@ -236,19 +539,19 @@ class YandexMusicService:
             not_found_message=not_found_message
         )
 
-        self.__logger.info(f'Received response with data of artist from {uri}')
+        self.__logger.info('Received response with data of artist from %s', uri)
 
         # It means that Yandex Music API returned unexpected response
-        if not contains_key(result, artist_key):
+        if result.get(artist_key) is None:
             no_key_message: str = f'Response from {uri} does not contains key "{artist_key}"'
             self.__logger.warning(no_key_message)
             raise InternalServiceErrorException(no_key_message)
 
-        artist_dict: str_dict = get_dict_value(result, artist_key)
+        artist_dict: str_dict = result[artist_key]
 
         # It means that Yandex Music API returned artist with error-key, so really this artist not found
-        if get_dict_value_or_none(artist_dict, 'error'):
-            self.__logger.info(f'Artist from {uri} not found')
+        if artist_dict.get('error'):
+            self.__logger.info('Artist from %s not found', uri)
             raise NotFoundException(not_found_message)
 
         return result
@@ -263,186 +566,61 @@ class YandexMusicService:
         :raises InternalServiceErrorException: internal error during fetching data.
         """
 
-        self.__logger.info(f'Fetching data from {uri} ...')
+        self.__logger.info('Fetching data from %s ...', uri)
 
         result_key: str = 'result'
 
-        try:
-            response: aiohttp.ClientResponse = await self.__session.get(url=uri)
-            self.__logger.info(f'Received {response.status} - {response.reason} from {uri}')
-            response_json: str_dict = await response.json()
-            self.__logger.info(f'Response from {uri} is JSON')
-        except Exception as e:
-            message: str = f'Downloading JSON from {uri} failed'
-            self.__logger.warning(f'{message}: {str(e)}')
-            raise InternalServiceErrorException(message) from e
-        else:
-            status: int = response.status
-
-            is_status_ok: bool = 200 <= status <= 299
-            is_status_client_error: bool = 400 <= status <= 499
-
-            if is_status_ok:
-                result: Optional[str_dict] = get_dict_value_or_none(response_json, result_key)
-                if result:
-                    return result
-
-                malformed_message: str = f'Key "{result_key}" not found in response from Yandex Music API'
-                self.__logger.warning(malformed_message)
-                raise InternalServiceErrorException(malformed_message)
-
-            if is_status_client_error:
-                raise NotFoundException(not_found_message)
-
-            # Got unexpected HTTP-code
-            raise InternalServiceErrorException(f'Yandex Music API returned "{status} - {response.reason}" from {uri}')
-
-    @staticmethod
-    def __extract_concert(concert: str_dict, artist: Artist) -> Concert:
-        """
-        Extracts :class:`Concert` from Yandex Music API JSON-dictionary of concert.
-
-        :param concert: Yandex Music API JSON-dictionary of concert.
-        :raises KeyError: Yandex Music API JSON-dictionary doesn't have all required keys.
-        """
-
-        concert_datetime = datetime.strptime(get_dict_value(concert, 'datetime'), '%Y-%m-%dT%H:%M:%S%z')
-
-        concert_images: Optional[list[str]] = get_dict_value_or_none(concert, 'images')
-
-        concert_min_price_dict: Optional[str_dict] = get_dict_value_or_none(concert, 'minPrice')
-        min_price: Optional[Price] = None
-        if concert_min_price_dict:
-            concert_min_price_value: int = int(get_dict_value(concert_min_price_dict, 'value'))
-            concert_min_price_currency = get_dict_value(concert_min_price_dict, 'currency')
-            min_price = Price(price=concert_min_price_value, currency=concert_min_price_currency)
-
-        return Concert(
-            title=get_dict_value(concert, 'concertTitle'),
-            afisha_url=get_dict_value(concert, 'afishaUrl'),
-            city=get_dict_value(concert, 'city'),
-            place=get_dict_value_or_none(concert, 'place'),
-            address=get_dict_value(concert, 'address'),
-            datetime=concert_datetime,
-            map_url=get_dict_value_or_none(concert, 'mapUrl'),
-            images=concert_images if concert_images is not None else [],
-            min_price=min_price,
-            artists=[artist]
-        )
-
-    @staticmethod
-    def __extract_playlist(url: str, playlist: str_dict) -> TrackList:
-        """
-        Extracts :class:`TrackList` from Yandex Music API JSON-dictionary of playlist.
-
-        :param url: url of playlist (passed just to be put to :class:`TrackList`).
-        :param playlist: Yandex Music API JSON-dictionary of playlist.
-        :raises KeyError: Yandex Music API JSON-dictionary doesn't have all required keys.
-        """
-
-        artists: set[Artist] = set()
-        for short_track in get_dict_value(playlist, 'tracks'):
-            track: str_dict = get_dict_value(short_track, 'track')
-            for a in get_dict_value(track, 'artists'):
-                artists.add(YandexMusicService.__extract_artist(a))
-
-        cover_uri: Optional[str] = get_dict_value_or_none(playlist, 'ogImage')
-
-        return TrackList(
-            url=url,
-            title=get_dict_value(playlist, 'title'),
-            image=YandexMusicService.__get_cover_link(cover_uri),
-            artists=list(artists)
-        )
-
-    @staticmethod
-    def __extract_album(url: str, album: str_dict) -> TrackList:
-        """
-        Extracts :class:`TrackList` from Yandex Music API JSON-dictionary of album.
-
-        :param url: url of album (passed just to be put to :class:`TrackList`).
-        :param album: Yandex Music API JSON-dictionary of album.
-        :raises KeyError: Yandex Music API JSON-dictionary doesn't have all required keys.
-        """
-
-        artist_dicts: list[str_dict] = get_dict_value(album, 'artists')
-        parsed_artists: list[Artist] = [YandexMusicService.__extract_artist(a) for a in artist_dicts]
-        unique_parsed_artists = list(set(parsed_artists))
-        cover_uri: Optional[str] = get_dict_value_or_none(album, 'ogImage')
-
-        return TrackList(
-            url=url,
-            title=get_dict_value(album, 'title'),
-            image=YandexMusicService.__get_cover_link(cover_uri),
-            artists=unique_parsed_artists
-        )
-
-    @staticmethod
-    def __extract_artist(artist: str_dict) -> Artist:
-        """
-        Extracts :class:`Artist` from Yandex Music API JSON-dictionary of artist.
-
-        :param artist: Yandex Music API JSON-dictionary of artist.
-        :raises KeyError: Yandex Music API JSON-dictionary doesn't have all required keys.
-        """
-
-        return Artist(
-            name=get_dict_value(artist, 'name'),
-            yandex_music_id=get_dict_value(artist, 'id')
-        )
-
-    @staticmethod
-    def __create_artist_brief_info_api_uri(artist_id: int) -> str:
-        """
-        Returns url of artist's brief info on Yandex Music.
-
-        :param artist_id: id of artist on Yandex Music.
-        """
-
-        return f'/artists/{artist_id}/brief-info'
-
-    @staticmethod
-    def __create_artist_api_uri(artist_id: int) -> str:
-        """
-        Returns url of artist on Yandex Music.
-
-        :param artist_id: id of artist on Yandex Music.
-        """
-
-        return f'/artists/{artist_id}'
-
-    @staticmethod
-    def __create_playlist_api_uri(user_id: str, playlist_id: str) -> str:
-        """
-        Returns url of playlist on Yandex Music.
-
-        :param user_id: id of user on Yandex Music.
-        :param playlist_id: id of user's playlist on Yandex Music.
-        """
-
-        return f'/users/{user_id}/playlists/{playlist_id}'
-
-    @staticmethod
-    def __create_album_api_uri(album_id: str) -> str:
-        """
-        Returns url of album on Yandex Music.
-
-        :param album_id: id of album on Yandex Music.
-        """
+        for attempt in range(1, self.__max_attempts + 1):
+            try:
+                async with self.__session.get(url=uri) as response:
+                    self.__logger.info('Received %s - %s from %s', response.status, response.reason, uri)
+                    response.raise_for_status()
+                    response_json: str_dict = orjson.loads(await response.read())
+                self.__logger.info('Response from %s is JSON', uri)
+                break
+            except aiohttp.ClientResponseError as e:
+                if e.status in self.__retried_statuses and attempt < self.__max_attempts:
+                    retry_after: Optional[str] = e.headers.get('Retry-After') if e.headers else None
+                    delay: float = self.__get_retry_delay(attempt=attempt, retry_after=retry_after)
+                    self.__logger.info('Fetching %s failed with %s, retrying in %.2f s ...', uri, e.status, delay)
+                    await asyncio.sleep(delay)
+                    continue
+
+                # Rate limiting doesn't mean that data not found
+                if 400 <= e.status <= 499 and e.status != HTTPStatus.TOO_MANY_REQUESTS:
+                    raise NotFoundException(not_found_message) from e
+
+                # Got unexpected HTTP-code
+                message: str = f'Yandex Music API returned "{e.status} - {e.message}" from {uri}'
+                self.__logger.warning(message)
+                raise InternalServiceErrorException(message) from e
+            except orjson.JSONDecodeError as e:
+                message: str = f'Response from {uri} is not JSON'
+                self.__logger.warning('%s: %s', message, e)
+                raise InternalServiceErrorException(message) from e
+            except Exception as e:
+                message: str = f'Downloading JSON from {uri} failed'
+                self.__logger.warning('%s: %s', message, e)
+                raise InternalServiceErrorException(message) from e
+
+        result: Optional[str_dict] = response_json.get(result_key)
+        if result:
+            return result
 
-        return f'/albums/{album_id}'
+        malformed_message: str = f'Key "{result_key}" not found in response from Yandex Music API'
+        self.__logger.warning(malformed_message)
+        raise InternalServiceErrorException(malformed_message)
 
-    @staticmethod
-    def __get_cover_link(abstract_uri: Optional[str]) -> Optional[str]:
+    def __get_retry_delay(self, attempt: int, retry_after: Optional[str]) -> float:
         """
-        Returns url of album/playlist link with size 400x400.
-
-        Example of abstract_uri:
-
-        avatars.yandex.net/get-music-content/5966316/a134df77.a.23033323-1/%%
+        Returns time in seconds to wait before retrying failed request to Yandex Music API.
 
-        :param abstract_uri: abstract url of album/playlist cover.
+        Delay requested by Yandex Music API is honored (but limited), otherwise it grows exponentially with jitter.
 
+        :param attempt: number of failed attempt (starting from 1).
+        :param retry_after: value of "Retry-After" header of failed response (if presented).
         """
 
-        return None if abstract_uri is None else f'https://{abstract_uri[:-2]}400x400'
+        if retry_after is not None and retry_after.isdigit():
+            return min(float(retry_after), self.__max_retry_delay)
+        return self.__retry_base_delay * 2 ** (attempt - 1) + random.uniform(0, self.__retry_base_delay / 2)
@@ -1,14 +1,43 @@
+import os
+from functools import lru_cache
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
+    host: str = '127.0.0.1'
+    port: int = 8000
+    workers: int = (os.cpu_count() or 1) * 2 + 1
+    yandex_connections: int = 32
+    yandex_dns_ttl: int = 300
+    yandex_keepalive_timeout: float = 75.0
+    yandex_request_timeout: float = 30.0
+    yandex_artist_cache_size: int = 1024
+    yandex_artist_cache_ttl: int = 60
+    max_inflight_yandex: int = 16
     redis_host: str = 'localhost'
     redis_port: int = 6379
     redis_password: str = 'password'
+    redis_pool_size: int = 32
+    redis_ping_timeout: float = 1.0
     concerts_expiration_time: int = 60
+    distant_concerts_expiration_time: int = 3600
+    imminent_concert_period: int = 3600
     track_lists_expiration_time: int = 600
+    negative_cache_ttl: int = 30
+    cache_ttl_jitter: float = 0.1
+    redis_batch_size: int = 64
+    redis_batch_window_ms: int = 2
+    local_cache_size: int = 1024
+    local_cache_ttl: int = 30
 
     model_config = SettingsConfigDict(env_file=".env")
 
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Returns settings of service. They are read (from environment and .env-file) on the first call only.
+    """
+
+    return Settings()